@@ -0,0 +1,87 @@
+# cython: language_level=3
+"""
+Optional C-level scanner for top-level import statements.
+
+Counts the same statements as the pure-Python _IMPORT_RE path in
+python_project_mcp ("import foo" and "from foo import ..." at line
+start), but lexes the raw bytes with a hand-coded state machine instead
+of regex dispatch. Build in place with:
+
+    cythonize -i _import_scan.pyx
+
+python_project_mcp picks this up automatically when the built extension
+is importable and falls back to the regex scanner otherwise.
+"""
+
+cdef inline bint _is_ident(unsigned char c):
+    return (48 <= c <= 57) or (65 <= c <= 90) or (97 <= c <= 122) or c == 95 or c == 46
+
+
+cdef inline bint _match_kw(const unsigned char* s, Py_ssize_t i, Py_ssize_t n,
+                           const char* kw, Py_ssize_t kw_len):
+    """Match a keyword at position i followed by a space or tab"""
+    cdef Py_ssize_t k
+    if i + kw_len >= n:
+        return False
+    for k in range(kw_len):
+        if s[i + k] != <unsigned char>kw[k]:
+            return False
+    return s[i + kw_len] == 32 or s[i + kw_len] == 9
+
+
+def scan_imports(bytes data, dict counts):
+    """Count top-level imported modules in raw source bytes into counts"""
+    cdef const unsigned char* s = data
+    cdef Py_ssize_t n = len(data)
+    cdef Py_ssize_t i = 0, start, end, k
+    cdef str module
+
+    while i < n:
+        # Skip leading indentation
+        while i < n and (s[i] == 32 or s[i] == 9):
+            i += 1
+
+        start = -1
+        end = -1
+        if _match_kw(s, i, n, b'import', 6):
+            i += 6
+            while i < n and (s[i] == 32 or s[i] == 9):
+                i += 1
+            start = i
+            while i < n and _is_ident(s[i]):
+                i += 1
+            end = i
+        elif _match_kw(s, i, n, b'from', 4):
+            i += 4
+            while i < n and (s[i] == 32 or s[i] == 9):
+                i += 1
+            start = i
+            while i < n and _is_ident(s[i]):
+                i += 1
+            end = i
+            # Only count when "import" follows the module path
+            if end == start or i >= n or not (s[i] == 32 or s[i] == 9):
+                start = -1
+            else:
+                while i < n and (s[i] == 32 or s[i] == 9):
+                    i += 1
+                if i + 6 > n:
+                    start = -1
+                else:
+                    for k in range(6):
+                        if s[i + k] != <unsigned char>(b'import'[k]):
+                            start = -1
+                            break
+
+        if start >= 0 and end > start:
+            # Trim to the top-level module, i.e. up to the first '.'
+            k = start
+            while k < end and s[k] != 46:
+                k += 1
+            module = data[start:k].decode('ascii', 'replace')
+            counts[module] = counts.get(module, 0) + 1
+
+        # Skip the rest of the line; only the first statement per line counts
+        while i < n and s[i] != 10:
+            i += 1
+        i += 1
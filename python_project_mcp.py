@@ -8,18 +8,40 @@ dependencies and configurations.
 """
 
 import asyncio
+import fnmatch
 import json
 import logging
+import mmap
 import os
+import queue
+import re
 import sys
+import threading
+import tomllib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import mcp.server.stdio
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
+# Optional compiled import scanner (build with: cythonize -i _import_scan.pyx)
+try:
+    from _import_scan import scan_imports as _scan_imports_native
+except ImportError:
+    _scan_imports_native = None
+
+# Optional io_uring backend for bulk file reads (Linux only)
+try:
+    import liburing
+    _HAS_LIBURING = sys.platform == 'linux'
+except ImportError:
+    liburing = None
+    _HAS_LIBURING = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -31,21 +53,56 @@ DOC_EXTENSIONS = {'.md', '.rst', '.txt'}
 REQUIREMENTS_FILES = {'requirements.txt', 'requirements-dev.txt', 'pyproject.toml', 'setup.py', 'setup.cfg', 'Pipfile'}
 
 # Directories to exclude from exploration
-EXCLUDE_DIRS = {
+EXCLUDE_DIRS = frozenset({
     '__pycache__', '.git', '.svn', '.hg', '.bzr',
     '.tox', '.pytest_cache', '.mypy_cache', '.coverage',
     'node_modules', '.venv', 'venv', 'env', '.env',
     'build', 'dist', '.egg-info', '.eggs', 'htmlcov'
-}
+})
 
 # Maximum file size to read (in bytes)
 MAX_FILE_SIZE = 1024 * 1024  # 1MB
 
+# Maximum number of decoded files kept in the in-process content cache
+MAX_CONTENT_CACHE_ENTRIES = 512
+
+# Maximum number of search matches returned by search_code
+SEARCH_MATCH_LIMIT = 50
+
+# Worker count for the shared file-scanning thread pool
+POOL_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Units for human-readable file sizes; index i covers sizes < 1024**(i+1)
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Matches "import foo" and "from foo import ..." at line start, over raw bytes
+_IMPORT_RE = re.compile(
+    rb'(?m)^[ \t]*(?:import[ \t]+([A-Za-z0-9_.]+)|from[ \t]+([A-Za-z0-9_.]+)[ \t]+import)'
+)
+
+# Patterns for extracting dependencies from setup.py/setup.cfg
+_SETUP_REQ_RE = re.compile(r'(?:install_requires|requires)\s*=\s*\[(.*?)\]', re.DOTALL)
+_PKG_STR_RE = re.compile(r'["\']([^"\']+)["\']')
+_VER_SPLIT_RE = re.compile(r'[><=!~]')
+
+# Leading package name of a PEP 508 requirement string
+_DEP_NAME_RE = re.compile(r'[A-Za-z0-9_.\-]+')
+
+# Requirement name at the start of a requirements.txt line; lines opening
+# with '#' or '-' (comments, pip options) never match
+_REQ_LINE_RE = re.compile(rb'(?m)^[ \t]*([A-Za-z0-9_][A-Za-z0-9_.\-\[\]]*)')
+
 class PythonProjectMCP:
     def __init__(self):
         self.server = Server("python-project")
         self.root_directory: Optional[Path] = None
-        
+        self._python_files_cache: Optional[tuple] = None
+        self._excluded_prefixes: Optional[tuple] = None
+        self._content_cache: Dict[Path, tuple] = {}
+        self._indicators_cache: Optional[tuple] = None
+        self._req_files_cache: Optional[tuple] = None
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+
         # Register tools
         self._register_tools()
         self._register_handlers()
@@ -117,6 +174,11 @@ class PythonProjectMCP:
                                 "type": "boolean",
                                 "description": "Include test files (default: true)",
                                 "default": True
+                            },
+                            "refresh": {
+                                "type": "boolean",
+                                "description": "Re-scan the project instead of using cached results (default: false)",
+                                "default": False
                             }
                         }
                     }
@@ -131,6 +193,11 @@ class PythonProjectMCP:
                                 "type": "boolean",
                                 "description": "Analyze import statements in Python files (default: true)",
                                 "default": True
+                            },
+                            "refresh": {
+                                "type": "boolean",
+                                "description": "Re-scan the project instead of using cached results (default: false)",
+                                "default": False
                             }
                         }
                     }
@@ -153,6 +220,11 @@ class PythonProjectMCP:
                             "file_pattern": {
                                 "type": "string",
                                 "description": "Optional file pattern to limit search scope"
+                            },
+                            "refresh": {
+                                "type": "boolean",
+                                "description": "Re-scan the project instead of using cached results (default: false)",
+                                "default": False
                             }
                         },
                         "required": ["query"]
@@ -163,7 +235,13 @@ class PythonProjectMCP:
                     description="Get comprehensive project information including structure, dependencies, and metadata",
                     inputSchema={
                         "type": "object",
-                        "properties": {}
+                        "properties": {
+                            "refresh": {
+                                "type": "boolean",
+                                "description": "Re-scan the project instead of using cached results (default: false)",
+                                "default": False
+                            }
+                        }
                     }
                 )
             ]
@@ -171,6 +249,9 @@ class PythonProjectMCP:
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
             try:
+                if arguments.get("refresh"):
+                    self._invalidate_caches()
+
                 if name == "set_project_root":
                     return await self._set_project_root(arguments.get("path"))
                 elif name == "explore_project_structure":
@@ -223,7 +304,7 @@ class PythonProjectMCP:
                 ))
                 
                 # Add Python files as resources
-                for py_file in self._get_python_files():
+                for py_file, _size in await asyncio.to_thread(self._get_python_files):
                     rel_path = py_file.relative_to(self.root_directory)
                     resources.append(types.Resource(
                         uri=f"file://{rel_path}",
@@ -247,7 +328,9 @@ class PythonProjectMCP:
             elif uri.startswith("file://"):
                 file_path = uri[7:]  # Remove "file://" prefix
                 full_path = self.root_directory / file_path
-                return self._read_file_content(full_path)
+                if self._is_excluded(full_path):
+                    raise ValueError(f"File is in an excluded directory: {file_path}")
+                return await asyncio.to_thread(self._read_file_content, full_path)
             else:
                 raise ValueError(f"Unknown resource URI: {uri}")
     
@@ -261,19 +344,18 @@ class PythonProjectMCP:
                 return [types.TextContent(type="text", text=f"Error: Path is not a directory: {path}")]
             
             self.root_directory = root_path
-            
+
             # Validate it looks like a Python project
-            python_indicators = self._find_python_indicators()
+            python_indicators = await asyncio.to_thread(self._find_python_indicators)
             
-            response = f"Project root set to: {self.root_directory}\n\n"
+            parts = [f"Project root set to: {self.root_directory}\n\n"]
             if python_indicators:
-                response += "Python project indicators found:\n"
-                for indicator in python_indicators:
-                    response += f"  - {indicator}\n"
+                parts.append("Python project indicators found:\n")
+                parts.extend(f"  - {indicator}\n" for indicator in python_indicators)
             else:
-                response += "Warning: No clear Python project indicators found in this directory."
-            
-            return [types.TextContent(type="text", text=response)]
+                parts.append("Warning: No clear Python project indicators found in this directory.")
+
+            return [types.TextContent(type="text", text="".join(parts))]
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error setting project root: {e}")]
     
@@ -281,25 +363,41 @@ class PythonProjectMCP:
         """Find indicators that this is a Python project"""
         if not self.root_directory:
             return []
-        
+
+        cache_key = (self.root_directory, self.root_directory.stat().st_mtime_ns)
+        if self._indicators_cache and self._indicators_cache[0] == cache_key:
+            return self._indicators_cache[1]
+
+        # One scandir pass over the root collects everything the checks
+        # below need, instead of a glob plus per-entry exists() syscalls
+        names = set()
+        py_file_count = 0
+        package_count = 0
+        with os.scandir(self.root_directory) as it:
+            for entry in it:
+                names.add(entry.name)
+                if entry.is_file(follow_symlinks=False):
+                    if entry.name.endswith('.py'):
+                        py_file_count += 1
+                elif entry.is_dir(follow_symlinks=False):
+                    if os.path.exists(os.path.join(entry.path, '__init__.py')):
+                        package_count += 1
+
         indicators = []
-        
+
         # Check for Python files
-        python_files = list(self.root_directory.glob("*.py"))
-        if python_files:
-            indicators.append(f"{len(python_files)} Python files in root")
-        
+        if py_file_count:
+            indicators.append(f"{py_file_count} Python files in root")
+
         # Check for common Python project files
-        for file_name in REQUIREMENTS_FILES:
-            if (self.root_directory / file_name).exists():
-                indicators.append(f"Found {file_name}")
-        
+        for file_name in sorted(REQUIREMENTS_FILES & names):
+            indicators.append(f"Found {file_name}")
+
         # Check for Python packages (directories with __init__.py)
-        packages = [d for d in self.root_directory.iterdir() 
-                   if d.is_dir() and (d / "__init__.py").exists()]
-        if packages:
-            indicators.append(f"{len(packages)} Python packages found")
-        
+        if package_count:
+            indicators.append(f"{package_count} Python packages found")
+
+        self._indicators_cache = (cache_key, indicators)
         return indicators
     
     async def _explore_project_structure(self, max_depth: int, include_hidden: bool) -> list[types.TextContent]:
@@ -308,45 +406,58 @@ class PythonProjectMCP:
             return [types.TextContent(type="text", text="Error: No project root set")]
         
         try:
-            structure = self._build_directory_tree(self.root_directory, max_depth, include_hidden)
+            # The tree walk is all blocking syscalls; keep it off the event loop
+            structure = await asyncio.to_thread(
+                self._build_directory_tree, self.root_directory, max_depth, include_hidden
+            )
             return [types.TextContent(type="text", text=structure)]
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error exploring structure: {e}")]
     
-    def _build_directory_tree(self, path: Path, max_depth: int, include_hidden: bool, current_depth: int = 0) -> str:
+    def _build_directory_tree(self, path: Path, max_depth: int, include_hidden: bool) -> str:
         """Build a text representation of directory structure"""
-        if current_depth >= max_depth:
+        if max_depth <= 0:
             return ""
-        
-        tree_lines = []
-        indent = "  " * current_depth
-        
-        try:
-            items = sorted(path.iterdir(), key=lambda x: (x.is_file(), x.name.lower()))
-            
-            for item in items:
-                # Skip hidden files/dirs unless requested
-                if not include_hidden and item.name.startswith('.'):
-                    continue
-                
+
+        tree_lines: List[str] = []
+        # Stack of (DirEntry, depth); directories are expanded on pop, so
+        # entries render in depth-first order without recursion
+        stack: List[tuple] = []
+
+        def push_children(directory: str, depth: int):
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(
+                        it, key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower())
+                    )
+            except PermissionError:
+                tree_lines.append(f"{'  ' * depth}❌ Permission denied")
+                return
+            for entry in reversed(entries):
+                stack.append((entry, depth))
+
+        push_children(str(path), 0)
+        while stack:
+            entry, depth = stack.pop()
+
+            # Skip hidden files/dirs unless requested
+            if not include_hidden and entry.name.startswith('.'):
+                continue
+
+            indent = "  " * depth
+            if entry.is_dir(follow_symlinks=False):
                 # Skip excluded directories
-                if item.is_dir() and item.name in EXCLUDE_DIRS:
+                if entry.name in EXCLUDE_DIRS:
                     continue
-                
-                if item.is_dir():
-                    tree_lines.append(f"{indent}📁 {item.name}/")
-                    if current_depth < max_depth - 1:
-                        subtree = self._build_directory_tree(item, max_depth, include_hidden, current_depth + 1)
-                        if subtree:
-                            tree_lines.append(subtree)
-                else:
-                    icon = self._get_file_icon(item)
-                    size = self._format_file_size(item.stat().st_size)
-                    tree_lines.append(f"{indent}{icon} {item.name} ({size})")
-        
-        except PermissionError:
-            tree_lines.append(f"{indent}❌ Permission denied")
-        
+                tree_lines.append(f"{indent}📁 {entry.name}/")
+                if depth + 1 < max_depth:
+                    push_children(entry.path, depth + 1)
+            else:
+                icon = self._get_file_icon(Path(entry.path))
+                # DirEntry serves the size from its cached stat
+                size = self._format_file_size(entry.stat(follow_symlinks=False).st_size)
+                tree_lines.append(f"{indent}{icon} {entry.name} ({size})")
+
         return "\n".join(tree_lines)
     
     def _get_file_icon(self, file_path: Path) -> str:
@@ -365,11 +476,12 @@ class PythonProjectMCP:
     
     def _format_file_size(self, size_bytes: int) -> str:
         """Format file size in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f}{unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.1f}TB"
+        if size_bytes <= 0:
+            return "0.0B"
+        # The unit index is just the size's bit length in units of 10
+        # (1024 == 1 << 10), so no division loop is needed
+        index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (index * 10)):.1f}{_SIZE_UNITS[index]}"
     
     async def _read_file(self, file_path: str) -> list[types.TextContent]:
         """Read contents of a specific file"""
@@ -382,43 +494,96 @@ class PythonProjectMCP:
             if not path.is_absolute():
                 path = self.root_directory / path
             
-            content = self._read_file_content(path)
+            content = await asyncio.to_thread(self._read_file_content, path)
             return [types.TextContent(type="text", text=f"File: {path.relative_to(self.root_directory)}\n\n{content}")]
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error reading file: {e}")]
     
     def _read_file_content(self, file_path: Path) -> str:
         """Read file content with error handling"""
-        if not file_path.exists():
+        try:
+            stat_result = file_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
-        
-        if file_path.stat().st_size > MAX_FILE_SIZE:
-            raise ValueError(f"File too large: {file_path} ({self._format_file_size(file_path.stat().st_size)})")
-        
+
+        if stat_result.st_size > MAX_FILE_SIZE:
+            raise ValueError(f"File too large: {file_path} ({self._format_file_size(stat_result.st_size)})")
+
+        # Serve unchanged files from the in-process cache; several tools
+        # (imports analysis, search, requirement parsing) read the same files
+        cache_key = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._content_cache.get(file_path)
+        if cached and cached[0] == cache_key:
+            return cached[1]
+
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+        # Short-circuit binary files before attempting a full decode
+        if b'\x00' in data[:4096]:
+            raise ValueError(f"File appears to be binary: {file_path}")
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            content = data.decode('utf-8')
         except UnicodeDecodeError:
             # Try with different encoding
-            with open(file_path, 'r', encoding='latin-1') as f:
-                return f.read()
+            content = data.decode('latin-1')
+
+        if len(self._content_cache) >= MAX_CONTENT_CACHE_ENTRIES:
+            self._content_cache.clear()
+        self._content_cache[file_path] = (cache_key, content)
+        return content
     
-    def _get_python_files(self) -> List[Path]:
-        """Get all Python files in the project"""
+    def _get_python_files(self) -> List[Tuple[Path, int]]:
+        """Get all Python files in the project, with their sizes in bytes"""
         if not self.root_directory:
             return []
-        
+
+        # Reuse the previous walk if the root is unchanged, so successive
+        # tools (imports analysis, search, overview) share one traversal
+        cache_key = (self.root_directory, self.root_directory.stat().st_mtime_ns)
+        if self._python_files_cache and self._python_files_cache[0] == cache_key:
+            return self._python_files_cache[1]
+
+        # Single iterative scandir walk that prunes excluded directories
+        # during descent, so e.g. .venv and node_modules are never entered
+        extensions = tuple(PYTHON_EXTENSIONS)
         python_files = []
-        for ext in PYTHON_EXTENSIONS:
-            python_files.extend(self.root_directory.rglob(f"*{ext}"))
-        
-        # Filter out files in excluded directories
-        filtered_files = []
-        for file_path in python_files:
-            if not any(part in EXCLUDE_DIRS for part in file_path.parts):
-                filtered_files.append(file_path)
-        
-        return sorted(filtered_files)
+        excluded_prefixes = []
+        stack = [str(self.root_directory)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name in EXCLUDE_DIRS:
+                                excluded_prefixes.append(entry.path + os.sep)
+                            else:
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            if entry.name.endswith(extensions):
+                                # DirEntry serves the size from its cached stat,
+                                # saving a later stat() per displayed file
+                                size = entry.stat(follow_symlinks=False).st_size
+                                python_files.append((Path(entry.path), size))
+            except PermissionError:
+                logger.warning(f"Permission denied scanning {directory}")
+
+        python_files.sort()
+        self._excluded_prefixes = tuple(excluded_prefixes)
+        self._python_files_cache = (cache_key, python_files)
+        return python_files
+
+    def _is_excluded(self, path: Path) -> bool:
+        """Check whether a path lies inside an excluded directory"""
+        # Normalize so ".." segments cannot sidestep the comparison
+        path = Path(os.path.normpath(path))
+        if self._excluded_prefixes is not None:
+            path_str = str(path)
+            return any(path_str.startswith(prefix) for prefix in self._excluded_prefixes)
+        # No walk recorded yet; fall back to checking each path component
+        return any(part in EXCLUDE_DIRS for part in path.parts)
     
     async def _find_python_files(self, pattern: Optional[str], include_tests: bool) -> list[types.TextContent]:
         """Find Python files with optional filtering"""
@@ -426,28 +591,28 @@ class PythonProjectMCP:
             return [types.TextContent(type="text", text="Error: No project root set")]
         
         try:
-            python_files = self._get_python_files()
-            
-            # Apply pattern filter if provided
+            python_files = await asyncio.to_thread(self._get_python_files)
+
+            # Apply pattern filter if provided; translate the glob once and
+            # match with the compiled regex instead of fnmatch per file
             if pattern:
-                import fnmatch
-                python_files = [f for f in python_files if fnmatch.fnmatch(f.name, pattern)]
-            
+                pattern_re = re.compile(fnmatch.translate(pattern))
+                python_files = [f for f in python_files if pattern_re.match(f[0].name)]
+
             # Filter out test files if requested
             if not include_tests:
-                python_files = [f for f in python_files 
-                              if not any(part.startswith('test') for part in f.parts)]
-            
+                python_files = [f for f in python_files
+                              if not any(part.startswith('test') for part in f[0].parts)]
+
             if not python_files:
                 return [types.TextContent(type="text", text="No Python files found matching criteria")]
-            
-            result = f"Found {len(python_files)} Python files:\n\n"
-            for file_path in python_files:
+
+            parts = [f"Found {len(python_files)} Python files:\n\n"]
+            for file_path, file_size in python_files:
                 rel_path = file_path.relative_to(self.root_directory)
-                size = self._format_file_size(file_path.stat().st_size)
-                result += f"  🐍 {rel_path} ({size})\n"
-            
-            return [types.TextContent(type="text", text=result)]
+                parts.append(f"  🐍 {rel_path} ({self._format_file_size(file_size)})\n")
+
+            return [types.TextContent(type="text", text="".join(parts))]
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error finding Python files: {e}")]
     
@@ -457,135 +622,288 @@ class PythonProjectMCP:
             return [types.TextContent(type="text", text="Error: No project root set")]
         
         try:
-            result = "Project Dependencies Analysis\n" + "="*35 + "\n\n"
-            
+            parts = ["Project Dependencies Analysis\n" + "="*35 + "\n\n"]
+
             # Analyze requirements files
-            deps_from_files = self._analyze_requirement_files()
+            deps_from_files = await asyncio.to_thread(self._analyze_requirement_files)
             if deps_from_files:
-                result += "Dependencies from requirements files:\n"
+                parts.append("Dependencies from requirements files:\n")
                 for file_name, deps in deps_from_files.items():
-                    result += f"\n{file_name}:\n"
-                    for dep in deps[:10]:  # Limit to first 10
-                        result += f"  - {dep}\n"
+                    parts.append(f"\n{file_name}:\n")
+                    parts.extend(f"  - {dep}\n" for dep in deps[:10])  # Limit to first 10
                     if len(deps) > 10:
-                        result += f"  ... and {len(deps) - 10} more\n"
-            
+                        parts.append(f"  ... and {len(deps) - 10} more\n")
+
             # Analyze imports if requested
             if include_imports:
-                imports = self._analyze_imports()
+                imports = await self._analyze_imports()
                 if imports:
-                    result += f"\nImported modules (top 20):\n"
+                    parts.append(f"\nImported modules (top 20):\n")
                     sorted_imports = sorted(imports.items(), key=lambda x: x[1], reverse=True)
-                    for module, count in sorted_imports[:20]:
-                        result += f"  - {module} (used {count} times)\n"
-            
-            return [types.TextContent(type="text", text=result)]
+                    parts.extend(f"  - {module} (used {count} times)\n"
+                                 for module, count in sorted_imports[:20])
+
+            return [types.TextContent(type="text", text="".join(parts))]
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error analyzing dependencies: {e}")]
     
     def _analyze_requirement_files(self) -> Dict[str, List[str]]:
         """Analyze requirements from various requirement files"""
+        # Reuse the previous parse while no requirement file has changed
+        cache_key = []
+        for req_file in sorted(REQUIREMENTS_FILES):
+            try:
+                st = (self.root_directory / req_file).stat()
+                cache_key.append((req_file, st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                continue
+        cache_key = tuple(cache_key)
+        if self._req_files_cache and self._req_files_cache[0] == cache_key:
+            return self._req_files_cache[1]
+
         results = {}
-        
-        for req_file in REQUIREMENTS_FILES:
+        for req_file, _mtime_ns, _size in cache_key:
             file_path = self.root_directory / req_file
-            if file_path.exists():
-                try:
-                    if req_file.endswith('.txt'):
-                        deps = self._parse_requirements_txt(file_path)
-                    elif req_file == 'pyproject.toml':
-                        deps = self._parse_pyproject_toml(file_path)
-                    elif req_file in ['setup.py', 'setup.cfg']:
-                        deps = self._parse_setup_file(file_path)
-                    else:
-                        continue
-                    
-                    if deps:
-                        results[req_file] = deps
-                except Exception as e:
-                    logger.warning(f"Error parsing {req_file}: {e}")
-        
+            try:
+                if req_file.endswith('.txt'):
+                    deps = self._parse_requirements_txt(file_path)
+                elif req_file == 'pyproject.toml':
+                    deps = self._parse_pyproject_toml(file_path)
+                elif req_file in ['setup.py', 'setup.cfg']:
+                    deps = self._parse_setup_file(file_path)
+                else:
+                    continue
+
+                if deps:
+                    results[req_file] = deps
+            except Exception as e:
+                logger.warning(f"Error parsing {req_file}: {e}")
+
+        self._req_files_cache = (cache_key, results)
         return results
+
+    def _invalidate_caches(self):
+        """Drop all per-project caches so the next tool call re-scans"""
+        self._python_files_cache = None
+        self._excluded_prefixes = None
+        self._content_cache.clear()
+        self._indicators_cache = None
+        self._req_files_cache = None
     
     def _parse_requirements_txt(self, file_path: Path) -> List[str]:
         """Parse requirements.txt style files"""
-        deps = []
-        content = self._read_file_content(file_path)
-        for line in content.split('\n'):
-            line = line.strip()
-            if line and not line.startswith('#') and not line.startswith('-'):
-                deps.append(line.split()[0])  # Take first part before any options
-        return deps
+        # One regex pass over the raw bytes instead of per-line
+        # strip/startswith/split churn
+        data = file_path.read_bytes()
+        return [match.group(1).decode('ascii', 'replace')
+                for match in _REQ_LINE_RE.finditer(data)]
     
     def _parse_pyproject_toml(self, file_path: Path) -> List[str]:
         """Parse pyproject.toml for dependencies"""
+        with open(file_path, 'rb') as f:
+            data = tomllib.load(f)
+
         deps = []
-        content = self._read_file_content(file_path)
-        
-        # Simple parsing - look for dependencies sections
-        in_deps_section = False
-        for line in content.split('\n'):
-            line = line.strip()
-            if line.startswith('[tool.poetry.dependencies]') or line.startswith('dependencies = ['):
-                in_deps_section = True
-                continue
-            elif line.startswith('[') and in_deps_section:
-                in_deps_section = False
-            elif in_deps_section and '=' in line:
-                dep_name = line.split('=')[0].strip().strip('"\'')
-                if dep_name != 'python':
-                    deps.append(dep_name)
-        
-        return deps
+
+        def add_requirement(spec: str):
+            match = _DEP_NAME_RE.match(spec.strip())
+            if match:
+                deps.append(match.group(0))
+
+        # PEP 621 [project] dependencies and optional-dependencies
+        project = data.get('project', {})
+        for spec in project.get('dependencies', []):
+            add_requirement(spec)
+        for extra_specs in project.get('optional-dependencies', {}).values():
+            for spec in extra_specs:
+                add_requirement(spec)
+
+        # Poetry dependency tables, including dependency groups
+        poetry = data.get('tool', {}).get('poetry', {})
+        dep_tables = [poetry.get('dependencies', {})]
+        dep_tables.extend(group.get('dependencies', {})
+                          for group in poetry.get('group', {}).values())
+        for table in dep_tables:
+            deps.extend(name for name in table if name != 'python')
+
+        # Preserve order while dropping duplicates across tables
+        return list(dict.fromkeys(deps))
     
     def _parse_setup_file(self, file_path: Path) -> List[str]:
         """Extract dependencies from setup.py/setup.cfg"""
         # This is a simplified parser - in practice you might want more robust parsing
         deps = []
         content = self._read_file_content(file_path)
-        
+
         # Look for install_requires or similar patterns
-        import re
-        patterns = [
-            r'install_requires\s*=\s*\[(.*?)\]',
-            r'requires\s*=\s*\[(.*?)\]'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.DOTALL)
-            for match in matches:
-                # Extract package names from strings
-                package_strings = re.findall(r'["\']([^"\']+)["\']', match)
-                for pkg in package_strings:
-                    deps.append(pkg.split('>=')[0].split('==')[0].split('<')[0].strip())
-        
+        for match in _SETUP_REQ_RE.finditer(content):
+            # Extract package names from strings
+            for pkg in _PKG_STR_RE.findall(match.group(1)):
+                deps.append(_VER_SPLIT_RE.split(pkg, 1)[0].strip())
+
         return deps
     
-    def _analyze_imports(self) -> Dict[str, int]:
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Get the shared thread pool for file scanning"""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=POOL_WORKERS,
+                thread_name_prefix="mcp-io"
+            )
+        return self._io_pool
+
+    async def _analyze_imports(self) -> Dict[str, int]:
         """Analyze import statements in Python files"""
-        import_counts = {}
-        python_files = self._get_python_files()
-        
-        import re
-        import_patterns = [
-            r'^import\s+([^\s,]+)',
-            r'^from\s+([^\s,]+)\s+import',
-        ]
-        
-        for file_path in python_files:
+        python_files = [file_path for file_path, _size
+                        in await asyncio.to_thread(self._get_python_files)]
+        if not python_files:
+            return {}
+
+        import_counts = Counter()
+
+        if _HAS_LIBURING:
+            # Batch reads through io_uring, prefetching the next batch
+            # while the current one is being scanned
+            def scan_all() -> Counter:
+                counts = Counter()
+                for _file_path, data in self._iter_bulk_read(python_files):
+                    counts.update(self._scan_import_bytes(data))
+                return counts
+
+            import_counts.update(await asyncio.to_thread(scan_all))
+            return dict(import_counts)
+
+        # Scan files in the thread pool so reads overlap instead of
+        # blocking the event loop one file at a time
+        loop = asyncio.get_running_loop()
+        pool = self._get_io_pool()
+        counters = await asyncio.gather(
+            *(loop.run_in_executor(pool, self._scan_file_imports, file_path)
+              for file_path in python_files)
+        )
+
+        for counter in counters:
+            import_counts.update(counter)
+        return dict(import_counts)
+
+    def _scan_file_imports(self, file_path: Path) -> Counter:
+        """Count top-level imported modules in a single file"""
+        data = self._read_bytes_quiet(file_path)
+        if data is None:
+            return Counter()
+        return self._scan_import_bytes(data)
+
+    def _scan_import_bytes(self, data: bytes) -> Counter:
+        """Count top-level imported modules in raw Python source bytes"""
+        import_counts = Counter()
+        if _scan_imports_native is not None:
+            _scan_imports_native(data, import_counts)
+            return import_counts
+        for match in _IMPORT_RE.finditer(data):
+            module = (match.group(1) or match.group(2)).split(b'.', 1)[0]
+            import_counts[module.decode('ascii', 'replace')] += 1
+        return import_counts
+
+    def _bulk_read(self, paths: List[Path]) -> Dict[Path, bytes]:
+        """Read many files, via io_uring when available"""
+        if _HAS_LIBURING:
             try:
-                content = self._read_file_content(file_path)
-                for line in content.split('\n'):
-                    line = line.strip()
-                    for pattern in import_patterns:
-                        match = re.match(pattern, line)
-                        if match:
-                            module = match.group(1).split('.')[0]  # Get top-level module
-                            import_counts[module] = import_counts.get(module, 0) + 1
+                return self._bulk_read_io_uring(paths)
             except Exception as e:
-                logger.warning(f"Error analyzing imports in {file_path}: {e}")
-        
-        return import_counts
+                logger.warning(f"io_uring bulk read failed, falling back to threads: {e}")
+
+        results = {}
+        pool = self._get_io_pool()
+        for path, data in zip(paths, pool.map(self._read_bytes_quiet, paths)):
+            if data is not None:
+                results[path] = data
+        return results
+
+    def _iter_bulk_read(self, paths: List[Path], batch_size: int = 256):
+        """Yield (path, data) pairs, reading ahead of the consumer
+
+        A producer thread pulls batches through _bulk_read and parks them in
+        a bounded queue, so the next batch is already being read from disk
+        while the caller scans the current one. Memory stays capped at a
+        couple of batches.
+        """
+        results: queue.Queue = queue.Queue(maxsize=2)
+
+        def producer():
+            try:
+                for start in range(0, len(paths), batch_size):
+                    results.put(self._bulk_read(paths[start:start + batch_size]))
+            except Exception as e:
+                logger.warning(f"Prefetch read failed: {e}")
+            finally:
+                results.put(None)
+
+        threading.Thread(target=producer, daemon=True, name="mcp-prefetch").start()
+        while True:
+            batch = results.get()
+            if batch is None:
+                break
+            yield from batch.items()
+
+    def _read_bytes_quiet(self, path: Path) -> Optional[bytes]:
+        """Read raw bytes, returning None on failure"""
+        try:
+            if path.stat().st_size > MAX_FILE_SIZE:
+                return None
+            return path.read_bytes()
+        except OSError as e:
+            logger.warning(f"Error reading {path}: {e}")
+            return None
+
+    def _bulk_read_io_uring(self, paths: List[Path], depth: int = 256) -> Dict[Path, bytes]:
+        """Read files in batches of read submissions on one io_uring"""
+        results: Dict[Path, bytes] = {}
+        ring = liburing.io_uring()
+        liburing.io_uring_queue_init(depth, ring, 0)
+        cqe = liburing.io_uring_cqe()
+        try:
+            for start in range(0, len(paths), depth):
+                pending = []
+                for path in paths[start:start + depth]:
+                    try:
+                        fd = os.open(path, os.O_RDONLY)
+                    except OSError as e:
+                        logger.warning(f"Error reading {path}: {e}")
+                        continue
+                    size = os.fstat(fd).st_size
+                    if size > MAX_FILE_SIZE:
+                        os.close(fd)
+                        continue
+                    if size == 0:
+                        # Nothing to read; also keeps zero-length iovecs
+                        # out of the submission queue
+                        results[path] = b''
+                        os.close(fd)
+                        continue
+                    buf = bytearray(size)
+                    # The iovec must stay referenced until its completion is
+                    # reaped; the SQE only stores a pointer to it
+                    iov = liburing.iovec(buf)
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_readv(sqe, fd, iov, 1, 0)
+                    sqe.user_data = len(pending)
+                    pending.append((path, fd, buf, iov))
+
+                if not pending:
+                    continue
+                liburing.io_uring_submit(ring)
+                for _ in range(len(pending)):
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    path, fd, buf, _iov = pending[cqe.user_data]
+                    if cqe.res >= 0:
+                        results[path] = bytes(buf[:cqe.res])
+                    else:
+                        logger.warning(f"io_uring read failed for {path}: errno {-cqe.res}")
+                    os.close(fd)
+                    liburing.io_uring_cqe_seen(ring, cqe)
+        finally:
+            liburing.io_uring_queue_exit(ring)
+        return results
     
     async def _search_code(self, query: str, case_sensitive: bool, file_pattern: Optional[str]) -> list[types.TextContent]:
         """Search for patterns in Python files"""
@@ -593,46 +911,110 @@ class PythonProjectMCP:
             return [types.TextContent(type="text", text="Error: No project root set")]
         
         try:
-            python_files = self._get_python_files()
-            
+            python_files = [file_path for file_path, _size
+                            in await asyncio.to_thread(self._get_python_files)]
+
             # Apply file pattern filter if provided
             if file_pattern:
-                import fnmatch
-                python_files = [f for f in python_files if fnmatch.fnmatch(f.name, file_pattern)]
-            
-            matches = []
-            for file_path in python_files:
-                try:
-                    content = self._read_file_content(file_path)
-                    lines = content.split('\n')
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        search_line = line if case_sensitive else line.lower()
-                        search_query = query if case_sensitive else query.lower()
-                        
-                        if search_query in search_line:
-                            rel_path = file_path.relative_to(self.root_directory)
-                            matches.append({
-                                'file': str(rel_path),
-                                'line': line_num,
-                                'content': line.strip()
-                            })
-                except Exception as e:
-                    logger.warning(f"Error searching in {file_path}: {e}")
+                file_pattern_re = re.compile(fnmatch.translate(file_pattern))
+                python_files = [f for f in python_files if file_pattern_re.match(f.name)]
             
+            # Pre-filter files with a byte-level scan; only ASCII queries can
+            # use the byte probe safely, since they are encoded identically in
+            # UTF-8 and in the latin-1 fallback _read_file_content may decode
+            # with. A non-ASCII needle has different byte forms in the two
+            # encodings, so the probe could skip files whose decoded text
+            # matches.
+            probe = None
+            if query.isascii():
+                probe = re.compile(
+                    re.escape(query.encode('ascii')),
+                    0 if case_sensitive else re.IGNORECASE
+                )
+
+            # One compiled pattern replaces per-line lowercasing when locating
+            # match lines in files that pass the probe
+            line_pattern = re.compile(
+                re.escape(query), 0 if case_sensitive else re.IGNORECASE
+            )
+
+            # Search files in the thread pool in batches, stopping as soon
+            # as the response cap is reached instead of scanning everything
+            loop = asyncio.get_running_loop()
+            pool = self._get_io_pool()
+            batch_size = POOL_WORKERS * 2
+
+            matches: List[Dict[str, Any]] = []
+            overflow = False
+            for start in range(0, len(python_files), batch_size):
+                batch = python_files[start:start + batch_size]
+                per_file_matches = await asyncio.gather(
+                    *(loop.run_in_executor(pool, self._search_file, file_path,
+                                           line_pattern, probe, SEARCH_MATCH_LIMIT + 1)
+                      for file_path in batch)
+                )
+                for file_matches in per_file_matches:
+                    space = SEARCH_MATCH_LIMIT - len(matches)
+                    if len(file_matches) > space:
+                        matches.extend(file_matches[:space])
+                        overflow = True
+                    else:
+                        matches.extend(file_matches)
+                if len(matches) >= SEARCH_MATCH_LIMIT:
+                    if start + batch_size < len(python_files):
+                        overflow = True
+                    break
+
             if not matches:
                 return [types.TextContent(type="text", text=f"No matches found for '{query}'")]
-            
-            result = f"Found {len(matches)} matches for '{query}':\n\n"
-            for match in matches[:50]:  # Limit to first 50 matches
-                result += f"{match['file']}:{match['line']}: {match['content']}\n"
-            
-            if len(matches) > 50:
-                result += f"\n... and {len(matches) - 50} more matches"
-            
-            return [types.TextContent(type="text", text=result)]
+
+            if overflow:
+                parts = [f"Found at least {len(matches)} matches for '{query}' (truncated):\n\n"]
+            else:
+                parts = [f"Found {len(matches)} matches for '{query}':\n\n"]
+            parts.extend(f"{match['file']}:{match['line']}: {match['content']}\n"
+                         for match in matches)
+
+            if overflow:
+                parts.append("\n... more matches not shown")
+
+            return [types.TextContent(type="text", text="".join(parts))]
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error searching code: {e}")]
+
+    def _search_file(self, file_path: Path, line_pattern: re.Pattern,
+                     probe: Optional[re.Pattern] = None,
+                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find all matches of a query within a single file"""
+        matches = []
+        try:
+            # Cheap containment test on the raw bytes via mmap; most files
+            # do not contain the query and never need decoding
+            if probe is not None:
+                with open(file_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        return matches
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if probe.search(mm) is None:
+                            return matches
+
+            content = self._read_file_content(file_path)
+            lines = content.split('\n')
+
+            for line_num, line in enumerate(lines, 1):
+                if line_pattern.search(line):
+                    rel_path = file_path.relative_to(self.root_directory)
+                    matches.append({
+                        'file': str(rel_path),
+                        'line': line_num,
+                        'content': line.strip()
+                    })
+                    if limit is not None and len(matches) >= limit:
+                        break
+        except Exception as e:
+            logger.warning(f"Error searching in {file_path}: {e}")
+
+        return matches
     
     async def _get_project_info(self) -> list[types.TextContent]:
         """Get comprehensive project information"""
@@ -649,54 +1031,56 @@ class PythonProjectMCP:
         """Generate comprehensive project overview"""
         if not self.root_directory:
             return "No project root set"
-        
-        overview = f"Python Project Overview: {self.root_directory.name}\n"
-        overview += "=" * (25 + len(self.root_directory.name)) + "\n\n"
-        
+        return await asyncio.to_thread(self._sync_project_overview)
+
+    def _sync_project_overview(self) -> str:
+        """Blocking part of the project overview, run off the event loop"""
+        parts = [f"Python Project Overview: {self.root_directory.name}\n"]
+        parts.append("=" * (25 + len(self.root_directory.name)) + "\n\n")
+
         # Basic project info
-        overview += f"📁 Project Root: {self.root_directory}\n"
-        
+        parts.append(f"📁 Project Root: {self.root_directory}\n")
+
         # Project structure summary
         python_files = self._get_python_files()
-        overview += f"🐍 Python Files: {len(python_files)}\n"
-        
+        parts.append(f"🐍 Python Files: {len(python_files)}\n")
+
         # Find packages
-        packages = [d for d in self.root_directory.iterdir() 
+        packages = [d for d in self.root_directory.iterdir()
                    if d.is_dir() and (d / "__init__.py").exists()]
         if packages:
-            overview += f"📦 Python Packages: {len(packages)}\n"
-            for pkg in packages[:5]:  # Show first 5
-                overview += f"    - {pkg.name}\n"
+            parts.append(f"📦 Python Packages: {len(packages)}\n")
+            parts.extend(f"    - {pkg.name}\n" for pkg in packages[:5])  # Show first 5
             if len(packages) > 5:
-                overview += f"    ... and {len(packages) - 5} more\n"
-        
+                parts.append(f"    ... and {len(packages) - 5} more\n")
+
         # Configuration files
         config_files = []
         for file_name in REQUIREMENTS_FILES:
             if (self.root_directory / file_name).exists():
                 config_files.append(file_name)
-        
+
         if config_files:
-            overview += f"⚙️  Configuration Files: {', '.join(config_files)}\n"
-        
+            parts.append(f"⚙️  Configuration Files: {', '.join(config_files)}\n")
+
         # Documentation files
         doc_files = []
         for ext in DOC_EXTENSIONS:
             doc_files.extend(self.root_directory.glob(f"*{ext}"))
-        
+
         if doc_files:
-            overview += f"📝 Documentation: {len(doc_files)} files\n"
-        
+            parts.append(f"📝 Documentation: {len(doc_files)} files\n")
+
         # Quick dependency analysis
         deps_info = self._analyze_requirement_files()
         if deps_info:
             total_deps = sum(len(deps) for deps in deps_info.values())
-            overview += f"📋 Dependencies: ~{total_deps} packages\n"
-        
-        overview += "\n" + "=" * 50 + "\n"
-        overview += "Use other tools to explore specific aspects of the project!"
-        
-        return overview
+            parts.append(f"📋 Dependencies: ~{total_deps} packages\n")
+
+        parts.append("\n" + "=" * 50 + "\n")
+        parts.append("Use other tools to explore specific aspects of the project!")
+
+        return "".join(parts)
     
     async def run(self):
         """Run the MCP server"""